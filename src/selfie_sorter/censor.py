@@ -0,0 +1,876 @@
+"""
+Module for producing censored copies of sorted images.
+
+This module provides the :class:`ImageCensor` class, which renders censored
+copies of images based on the detection boxes recorded in the JSON sidecars
+written by :class:`~selfie_sorter.sorter.SelfieSorter`. Supported censor
+styles are pixelation, Gaussian blur, and opaque black boxes (optionally
+annotated with the detection label).
+
+The :func:`censor_sorted_tree` helper walks a sorted output tree, pairs each
+image with its sidecar, and writes a censored sibling copy for every image
+that has recorded detections.
+
+Exports:
+    - CensorBox (dataclass):
+        A resolved, pixel-space censor region.
+
+    - ImageCensor (class):
+        Renders censored copies of images.
+
+    - censor_sorted_tree (function):
+        Walks a sorted tree and writes censored copies.
+"""
+from __future__ import annotations
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .constants import IMAGE_EXTS
+
+
+try:
+    # ~3-5x faster than stdlib json on typical sidecar payloads.
+    from orjson import loads as _json_loads
+except Exception:
+    from json import loads as _json_loads
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+
+CENSOR_STYLES = ('pixelated', 'blurred', 'black_box')
+""" Supported censor styles. """
+
+
+_DEFAULT_EXTS_LOWER = frozenset(ext.lower() for ext in IMAGE_EXTS)
+""" Lowercased default image extensions, shared across calls and workers. """
+
+
+_VECTORIZE_MIN_DETECTIONS = 64
+""" Detection count above which box resolution switches to NumPy. """
+
+
+_cv2_module = None
+_cv2_checked = False
+
+
+def _import_cv2():
+    """
+    Imports and caches :mod:`cv2`, or ``None`` when OpenCV is unavailable.
+
+    Deferred so that importing :mod:`selfie_sorter.censor` (e.g. for the
+    CLI ``--help`` path) does not pay the OpenCV import cost.
+
+    Returns:
+        The :mod:`cv2` module, or ``None``.
+    """
+    global _cv2_module, _cv2_checked
+    if not _cv2_checked:
+        _cv2_checked = True
+        try:
+            import cv2
+            _cv2_module = cv2
+        except Exception:
+            _cv2_module = None
+    return _cv2_module
+
+
+_default_font = None
+
+
+def _get_default_font():
+    """
+    Loads and caches the label font on first use.
+
+    Returns:
+        The default PIL font, parsed once per process.
+    """
+    global _default_font
+    if _default_font is None:
+        from PIL import ImageFont
+        _default_font = ImageFont.load_default()
+    return _default_font
+
+
+def normalize_style(style: str) -> str:
+    """
+    Canonicalizes a censor style name (``'Black-Box'`` → ``'black_box'``).
+
+    Used as the argparse ``type=`` callable so the CLI hands
+    :class:`ImageCensor` an already-canonical name and the hot construction
+    path does no string munging.
+
+    Parameters:
+        style (str):
+            Style name in any case, with hyphens or underscores.
+
+    Returns:
+        str:
+            The canonical style name.
+    """
+    return style.lower().replace('-', '_')
+
+
+@functools.lru_cache(maxsize=4096)
+def _resolve_coords(coords: Tuple[float, float, float, float],
+                    width: int,
+                    height: int) -> Optional[Tuple[int, int, int, int]]:
+    """
+    Scales, rounds, and clamps a validated box; memoized per (box, size).
+
+    Boxes use NudeNet 3.x's ``(x, y, w, h)`` layout — top-left corner
+    plus extent — in absolute pixels, or normalized to ``[0, 1]`` (scaled
+    by the image size).
+
+    Parameters:
+        coords (Tuple[float, float, float, float]):
+            ``(x, y, w, h)`` box, absolute or normalized.
+
+        width (int):
+            Image width in pixels.
+
+        height (int):
+            Image height in pixels.
+
+    Returns:
+        Optional[Tuple[int, int, int, int]]:
+            ``(left, top, right, bottom)`` in pixels, or ``None`` when the
+            box is degenerate.
+    """
+    x, y, w, h = coords
+    if 0.0 <= min(coords) and max(coords) <= 1.0:
+        x, y, w, h = x * width, y * height, w * width, h * height
+
+    left, top = int(round(x)), int(round(y))
+    right, bottom = int(round(x + w)), int(round(y + h))
+    left, top = max(0, left), max(0, top)
+    right, bottom = min(width, right), min(height, bottom)
+    if right <= left or bottom <= top:
+        return None
+    return (left, top, right, bottom)
+
+
+@dataclass
+class CensorBox:
+    """
+    A censor region resolved to absolute pixel coordinates.
+
+    Attributes:
+        left (int):
+            Left edge of the region, in pixels.
+
+        top (int):
+            Top edge of the region, in pixels.
+
+        right (int):
+            Right edge of the region, in pixels.
+
+        bottom (int):
+            Bottom edge of the region, in pixels.
+
+        label (str):
+            Detection label that produced this box, if any.
+    """
+    left:   int
+    top:    int
+    right:  int
+    bottom: int
+    label:  str = ''
+
+    @property
+    def width(self) -> int:
+        """Width of the region in pixels."""
+        return self.right - self.left
+
+    @property
+    def height(self) -> int:
+        """Height of the region in pixels."""
+        return self.bottom - self.top
+
+
+class ImageCensor:
+    """
+    Renders censored copies of images from recorded detection boxes.
+
+    The censor never modifies the source image; :meth:`create_copy` writes a
+    new file alongside (or wherever the caller points it). The rendering
+    style and intensity are fixed at construction time.
+
+    Attributes:
+        style (str):
+            One of :data:`CENSOR_STYLES` (``'pixelated'``, ``'blurred'``,
+            ``'black_box'``).
+
+        strength (int):
+            Effect intensity. For pixelation this is the block size, for
+            blur the Gaussian radius. Ignored by the black-box style.
+
+        label_boxes (bool):
+            If True, black boxes are annotated with the detection label.
+    """
+    def __init__(self, style: str = 'pixelated', strength: int = 12, label_boxes: bool = False):
+        """
+        Initializes the censor.
+
+        Args:
+            style (str):
+                Canonical censor style name (see :data:`CENSOR_STYLES`).
+                Use :func:`normalize_style` first when accepting free-form
+                user input.
+
+            strength (int):
+                Effect intensity; clamped to at least 1.
+
+            label_boxes (bool):
+                Whether to annotate black boxes with detection labels.
+
+        Raises:
+            ValueError:
+                If ``style`` does not name a supported censor style.
+        """
+        if style not in CENSOR_STYLES:
+            raise ValueError(f'Unknown censor style: {style!r}')
+        self.style = style
+        self.strength = max(1, int(strength))
+        self.label_boxes = label_boxes
+        self._blur_backend = (self._blur_arr_cv2 if _import_cv2() is not None
+                              else self._blur_arr_pil)
+        # Baked per-instance filter state so the per-box kernels do no
+        # per-call construction.
+        self._blur_ksize = 2 * self.strength + 1
+        self._blur_filter = None
+
+    @staticmethod
+    def _normalize_box(box, width: int, height: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Resolves a raw detection box to clamped absolute pixel coordinates.
+
+        Accepts NudeNet 3.x ``[x, y, w, h]`` boxes in either absolute
+        pixels or normalized ``[0, 1]`` coordinates (scaled by the image
+        size). Thin wrapper over the memoized :func:`_resolve_coords`, so repeated
+        (box, size) pairs — common with overlapping detection classes —
+        skip the float math entirely.
+
+        Parameters:
+            box:
+                Raw 4-element box from a detection dictionary.
+
+            width (int):
+                Image width in pixels.
+
+            height (int):
+                Image height in pixels.
+
+        Returns:
+            Optional[Tuple[int, int, int, int]]:
+                ``(left, top, right, bottom)`` in pixels, or ``None`` when
+                the box is malformed or degenerate.
+        """
+        if not box or len(box) != 4:
+            return None
+        try:
+            coords = tuple(float(c) for c in box)
+        except (TypeError, ValueError):
+            return None
+        return _resolve_coords(coords, width, height)
+
+    def _resolve_boxes(self, detections: List[Dict], width: int, height: int) -> List[CensorBox]:
+        """
+        Converts raw detection dictionaries into :class:`CensorBox` regions.
+
+        Parameters:
+            detections (List[Dict]):
+                Detection dictionaries as recorded in a sidecar. Boxes are
+                read from the ``box``, ``bbox``, or ``rect`` key.
+
+            width (int):
+                Image width in pixels.
+
+            height (int):
+                Image height in pixels.
+
+        Returns:
+            List[CensorBox]:
+                Resolved regions; malformed detections are skipped.
+        """
+        if len(detections) >= _VECTORIZE_MIN_DETECTIONS:
+            boxes = self._resolve_boxes_vectorized(detections, width, height)
+            if boxes is not None:
+                return boxes
+
+        boxes: List[CensorBox] = []
+        for d in detections:
+            raw = d.get('box') or d.get('bbox') or d.get('rect')
+            coords = self._normalize_box(raw, width, height)
+            if coords is None:
+                continue
+            label = (d.get('label') or d.get('class') or '').strip()
+            boxes.append(CensorBox(*coords, label=label))
+        return boxes
+
+    @staticmethod
+    def _resolve_boxes_vectorized(detections: List[Dict],
+                                  width: int,
+                                  height: int) -> Optional[List[CensorBox]]:
+        """
+        Vectorized variant of :meth:`_resolve_boxes` for large detection sets.
+
+        Collects the raw boxes into one ``(N, 4)`` float array and performs
+        the normalized-coordinate scaling, rounding, and clamping as whole-
+        array NumPy operations, cutting the per-detection Python dispatch to
+        a single final construction pass.
+
+        Parameters:
+            detections (List[Dict]):
+                Detection dictionaries as recorded in a sidecar.
+
+            width (int):
+                Image width in pixels.
+
+            height (int):
+                Image height in pixels.
+
+        Returns:
+            Optional[List[CensorBox]]:
+                Resolved regions, or ``None`` when the boxes are too
+                irregular to vectorize (caller falls back to the loop).
+        """
+        raws = []
+        labels = []
+        for d in detections:
+            raw = d.get('box') or d.get('bbox') or d.get('rect')
+            if not raw or len(raw) != 4:
+                continue
+            raws.append(raw)
+            labels.append((d.get('label') or d.get('class') or '').strip())
+        if not raws:
+            return []
+
+        try:
+            arr = np.asarray(raws, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+
+        normalized = (arr >= 0.0).all(axis=1) & (arr <= 1.0).all(axis=1)
+        scale = np.array([width, height, width, height], dtype=np.float64)
+        arr[normalized] *= scale
+
+        # (x, y, w, h) -> corner pair, then round and clamp.
+        arr[:, 2] += arr[:, 0]
+        arr[:, 3] += arr[:, 1]
+        ints = np.rint(arr).astype(np.int64)
+        left = np.clip(ints[:, 0], 0, width)
+        top = np.clip(ints[:, 1], 0, height)
+        right = np.clip(ints[:, 2], 0, width)
+        bottom = np.clip(ints[:, 3], 0, height)
+        valid = (right > left) & (bottom > top)
+
+        return [CensorBox(int(l), int(t), int(r), int(b), label=lbl)
+                for l, t, r, b, lbl, ok
+                in zip(left, top, right, bottom, labels, valid) if ok]
+
+    @staticmethod
+    def _to_ndarray(image: 'Image.Image') -> 'np.ndarray':
+        """
+        Materializes an image as a writable NumPy array exactly once.
+
+        Regions are then taken as zero-copy slices of this array rather
+        than repeated ``image.crop()`` copies, so overlapping boxes never
+        duplicate pixel traffic.
+
+        Parameters:
+            image (Image.Image):
+                Source image; converted to RGB first when its mode has no
+                direct array layout.
+
+        Returns:
+            np.ndarray:
+                ``uint8`` buffer of shape ``(H, W)`` or ``(H, W, C)``.
+        """
+        if image.mode not in ('RGB', 'RGBA', 'L'):
+            image = image.convert('RGB')
+        return np.array(image)
+
+    def _pixelate_arr(self, view: 'np.ndarray') -> 'np.ndarray':
+        """
+        Pixelates a region buffer by downscaling and nearest-upscaling it.
+
+        When OpenCV is available the resizes run through ``cv2.resize`` with
+        ``INTER_AREA`` (SIMD box filter) down and ``INTER_NEAREST`` back up.
+        Without OpenCV, evenly-divisible regions take the C-level
+        ``Image.reduce`` path and ragged ones use a ``Resampling.BOX``
+        downscale (pure box averaging, cheaper than BILINEAR's float
+        filter math).
+
+        Parameters:
+            view (np.ndarray):
+                Region buffer to pixelate (a slice of the full-image array).
+
+        Returns:
+            np.ndarray:
+                The pixelated region, same shape as the input.
+        """
+        cv2 = _import_cv2()
+        h, w = view.shape[:2]
+        block = self.strength
+
+        if cv2 is not None:
+            shrink_w = max(1, w // block)
+            shrink_h = max(1, h // block)
+            small = cv2.resize(np.ascontiguousarray(view), (shrink_w, shrink_h),
+                               interpolation=cv2.INTER_AREA)
+            return cv2.resize(small, (w, h), interpolation=cv2.INTER_NEAREST)
+
+        from PIL import Image
+
+        resampling = getattr(Image, 'Resampling', Image)
+        region = Image.fromarray(view)
+        if block > 1 and w % block == 0 and h % block == 0:
+            # Image.reduce is C-level integer box averaging — fastest when
+            # the block size divides both dimensions.
+            small = region.reduce(block)
+        else:
+            small = region.resize((max(1, w // block), max(1, h // block)),
+                                  resampling.BOX)
+        return np.asarray(small.resize((w, h), resampling.NEAREST))
+
+    def _apply_pixelate(self, image: Image.Image, boxes: List[CensorBox]) -> Image.Image:
+        """
+        Pixelates every box region on a copy of the image.
+
+        Parameters:
+            image (Image.Image):
+                Source image; not modified.
+
+            boxes (List[CensorBox]):
+                Regions to pixelate.
+
+        Returns:
+            Image.Image:
+                A new image with the regions pixelated.
+        """
+        from PIL import Image
+
+        arr = self._to_ndarray(image)
+        for box in boxes:
+            view = arr[box.top:box.bottom, box.left:box.right]
+            arr[box.top:box.bottom, box.left:box.right] = self._pixelate_arr(view)
+        return Image.fromarray(arr)
+
+    def _apply_blur(self, image: Image.Image, boxes: List[CensorBox]) -> Image.Image:
+        """
+        Gaussian-blurs every box region on a copy of the image.
+
+        Parameters:
+            image (Image.Image):
+                Source image; not modified.
+
+            boxes (List[CensorBox]):
+                Regions to blur.
+
+        Returns:
+            Image.Image:
+                A new image with the regions blurred.
+        """
+        from PIL import Image
+
+        arr = self._to_ndarray(image)
+        for box in boxes:
+            view = arr[box.top:box.bottom, box.left:box.right]
+            arr[box.top:box.bottom, box.left:box.right] = self._blur_backend(view)
+        return Image.fromarray(arr)
+
+    def _blur_arr_cv2(self, view: 'np.ndarray') -> 'np.ndarray':
+        """
+        Gaussian-blurs a region buffer through OpenCV's SIMD separable filter.
+
+        Parameters:
+            view (np.ndarray):
+                Region buffer to blur.
+
+        Returns:
+            np.ndarray:
+                The blurred region, same shape as the input.
+        """
+        cv2 = _import_cv2()
+        k = self._blur_ksize
+        return cv2.GaussianBlur(np.ascontiguousarray(view), (k, k), 0,
+                                borderType=cv2.BORDER_REFLECT)
+
+    def _blur_arr_pil(self, view: 'np.ndarray') -> 'np.ndarray':
+        """
+        Gaussian-blurs a region buffer with PIL; fallback when OpenCV is
+        missing.
+
+        Parameters:
+            view (np.ndarray):
+                Region buffer to blur.
+
+        Returns:
+            np.ndarray:
+                The blurred region, same shape as the input.
+        """
+        from PIL import Image, ImageFilter
+
+        if self._blur_filter is None:
+            self._blur_filter = ImageFilter.GaussianBlur(radius=self.strength)
+        return np.asarray(Image.fromarray(view).filter(self._blur_filter))
+
+    def _black_box_regions(self, image: Image.Image, boxes: List[CensorBox]) -> Image.Image:
+        """
+        Covers every box region with an opaque black rectangle.
+
+        When :attr:`label_boxes` is set, the detection label is drawn in the
+        top-left corner of each rectangle.
+
+        Parameters:
+            image (Image.Image):
+                Source image; not modified.
+
+            boxes (List[CensorBox]):
+                Regions to cover.
+
+        Returns:
+            Image.Image:
+                A new image with the regions covered.
+        """
+        from PIL import Image, ImageDraw
+
+        arr = self._to_ndarray(image)
+        has_alpha = arr.ndim == 3 and arr.shape[2] == 4
+        for box in boxes:
+            if arr.ndim == 2:
+                arr[box.top:box.bottom, box.left:box.right] = 0
+            else:
+                arr[box.top:box.bottom, box.left:box.right, :3] = 0
+                if has_alpha:
+                    arr[box.top:box.bottom, box.left:box.right, 3] = 255
+        censored = Image.fromarray(arr)
+
+        if self.label_boxes:
+            draw = ImageDraw.Draw(censored)
+            for box in boxes:
+                if box.label:
+                    draw.text((box.left + 2, box.top + 2), box.label,
+                              fill=(255, 255, 255), font=_get_default_font())
+        return censored
+
+    def apply(self, image: Image.Image, boxes: List[CensorBox]) -> Image.Image:
+        """
+        Applies the configured censor style to the given regions.
+
+        Parameters:
+            image (Image.Image):
+                Source image; not modified.
+
+            boxes (List[CensorBox]):
+                Regions to censor.
+
+        Returns:
+            Image.Image:
+                A censored copy, or the original image if ``boxes`` is empty.
+        """
+        if not boxes:
+            return image
+        if self.style == 'pixelated':
+            return self._apply_pixelate(image, boxes)
+        if self.style == 'blurred':
+            return self._apply_blur(image, boxes)
+        return self._black_box_regions(image, boxes)
+
+    def create_copy(self, source: Path, destination: Path, detections: List[Dict]) -> Optional[Path]:
+        """
+        Writes a censored copy of ``source`` to ``destination``.
+
+        For heavily pixelated/blurred JPEG copies the decode is allowed to
+        DCT-downsample (:meth:`~PIL.Image.Image.draft`), so the copy is
+        deliberately written at the reduced size — the censor strength
+        discards that detail anyway. Detection boxes are always resolved
+        against the full-resolution geometry they were recorded at and
+        rescaled to whatever size the decode actually realized.
+
+        Parameters:
+            source (Path):
+                Path of the image to censor.
+
+            destination (Path):
+                Path the censored copy should be written to.
+
+            detections (List[Dict]):
+                Detection dictionaries (typically from the image's sidecar).
+
+        Returns:
+            Optional[Path]:
+                ``destination`` on success, or ``None`` when no usable boxes
+                were found or the image could not be processed.
+        """
+        from PIL import Image
+
+        try:
+            image = Image.open(source)
+            full_width, full_height = image.size
+            if image.format == 'JPEG' and self.style in ('pixelated', 'blurred'):
+                # Heavy pixelation/blur discards fine detail anyway, so let
+                # libjpeg DCT-downsample during decode when strength allows.
+                factor = max(1, self.strength // 4)
+                if factor > 1:
+                    image.draft('RGB', (full_width // factor, full_height // factor))
+            image.load()
+        except Exception:
+            return None
+
+        # Boxes were recorded against the full-resolution image; resolve
+        # them there, then rescale by whatever shrink the decode realized
+        # (libjpeg only honors power-of-two draft factors).
+        boxes = self._resolve_boxes(detections, full_width, full_height)
+        if image.size != (full_width, full_height):
+            sx = image.width / full_width
+            sy = image.height / full_height
+            boxes = [
+                scaled for scaled in (
+                    CensorBox(int(box.left * sx), int(box.top * sy),
+                              int(round(box.right * sx)), int(round(box.bottom * sy)),
+                              label=box.label)
+                    for box in boxes
+                )
+                if scaled.right > scaled.left and scaled.bottom > scaled.top
+            ]
+        if not boxes:
+            return None
+
+        censored = self.apply(image, boxes)
+        try:
+            censored.save(destination)
+        except Exception:
+            return None
+        return destination
+
+    def create_copies_batch(self,
+                            items: Iterable[Tuple[Path, Path, List[Dict]]],
+                            max_workers: Optional[int] = None) -> List[Optional[Path]]:
+        """
+        Censors many images through one shared censor and thread pool.
+
+        Pillow and OpenCV release the GIL in their native decode, filter,
+        and encode calls, so threads overlap the per-image work without
+        constructing a censor (and its cached filters) per file the way
+        the process-pool worker must.
+
+        Parameters:
+            items (Iterable[Tuple[Path, Path, List[Dict]]]):
+                ``(source, destination, detections)`` triples, as taken by
+                :meth:`create_copy`.
+
+            max_workers (Optional[int]):
+                Thread count. ``None`` uses ``os.cpu_count()``; ``1`` runs
+                sequentially in the calling thread.
+
+        Returns:
+            List[Optional[Path]]:
+                One :meth:`create_copy` result per item, in input order.
+        """
+        items = list(items)
+        workers = os.cpu_count() if max_workers is None else max(1, max_workers)
+        if workers == 1 or len(items) <= 1:
+            return [self.create_copy(src, dst, det) for src, dst, det in items]
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(lambda item: self.create_copy(*item), items))
+
+
+def _walk(root: Path, normalized_exts) -> Iterable[str]:
+    """
+    Yields paths of image files under ``root`` via :func:`os.scandir`.
+
+    Unlike ``root.rglob('*')`` this keeps the directory entry's cached file
+    type (no extra ``stat`` per entry), filters on extension before any
+    :class:`~pathlib.Path` object is built, and never materializes the full
+    file list.
+
+    Parameters:
+        root (Path):
+            Directory to walk.
+
+        normalized_exts:
+            Lowercase extensions (with dot) accepted as images.
+
+    Yields:
+        str:
+            Filesystem path of each matching file.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                except OSError:
+                    continue
+                if os.path.splitext(entry.name)[1].lower() in normalized_exts:
+                    yield entry.path
+
+
+def _read_detections(sidecar_path) -> List[Dict]:
+    """
+    Loads the detection list from a JSON sidecar.
+
+    Parameters:
+        sidecar_path:
+            Path of the sidecar file.
+
+    Returns:
+        List[Dict]:
+            The recorded detections; empty when the sidecar is missing,
+            unreadable, or records none.
+    """
+    try:
+        with open(sidecar_path, 'rb') as fh:
+            metadata = _json_loads(fh.read())
+    except Exception:
+        return []
+    return metadata.get('detections') or []
+
+
+def _censor_one(image_path: Path,
+                sidecar_path: Path,
+                censor_kwargs: Dict,
+                suffix: str) -> Optional[Path]:
+    """
+    Censors a single image/sidecar pair; worker body for the process pool.
+
+    Kept at module level (and handed construction kwargs rather than an
+    :class:`ImageCensor` instance) so it stays picklable for
+    :class:`~concurrent.futures.ProcessPoolExecutor`.
+
+    Parameters:
+        image_path (Path):
+            Path of the image to censor.
+
+        sidecar_path (Path):
+            Path of the image's JSON sidecar.
+
+        censor_kwargs (Dict):
+            Keyword arguments used to construct the worker's censor.
+
+        suffix (str):
+            Stem suffix for the censored copy.
+
+    Returns:
+        Optional[Path]:
+            Path of the created copy, or ``None`` when nothing was written.
+    """
+    detections = _read_detections(sidecar_path)
+    if not detections:
+        return None
+
+    censor = ImageCensor(**censor_kwargs)
+    censored_path = image_path.with_name(image_path.stem + suffix + image_path.suffix)
+    return censor.create_copy(image_path, censored_path, detections)
+
+
+def censor_sorted_tree(root: Path,
+                       censor: Optional[ImageCensor] = None,
+                       suffix: str = '_censored',
+                       image_exts: Iterable[str] = IMAGE_EXTS,
+                       jobs: Optional[int] = None,
+                       use_processes: bool = False) -> List[Path]:
+    """
+    Walks a sorted output tree and writes a censored copy of each image.
+
+    Every image under ``root`` whose JSON sidecar records detections gets a
+    sibling copy named ``<stem><suffix><ext>``. Images without a sidecar,
+    with no detections, or that already carry ``suffix`` are skipped.
+
+    Parameters:
+        root (Path):
+            Root of the sorted tree (typically ``SortConfig.root_out``).
+
+        censor (Optional[ImageCensor]):
+            Censor to use; a default :class:`ImageCensor` is created when
+            omitted.
+
+        suffix (str):
+            Stem suffix for censored copies.
+
+        image_exts (Iterable[str]):
+            File extensions considered images.
+
+        jobs (Optional[int]):
+            Number of workers. ``None`` uses ``os.cpu_count()``; ``1``
+            runs sequentially in-process.
+
+        use_processes (bool):
+            Use a process pool instead of threads. Threads are the
+            default — Pillow and OpenCV release the GIL in their native
+            decode/filter/encode calls, so a thread pool overlaps I/O and
+            compute without the pickling cost of processes.
+
+    Returns:
+        List[Path]:
+            Paths of the censored copies that were created.
+    """
+    censor = censor or ImageCensor()
+    if image_exts is IMAGE_EXTS:
+        normalized_exts = _DEFAULT_EXTS_LOWER
+    else:
+        normalized_exts = frozenset(ext.lower() for ext in image_exts)
+
+    candidates: List[Tuple[Path, Path]] = []
+    for entry_path in _walk(root, normalized_exts):
+        image_path = Path(entry_path)
+        if image_path.stem.endswith(suffix):
+            continue
+        sidecar_path = entry_path + '.json'
+        if not os.path.exists(sidecar_path):
+            continue
+        candidates.append((image_path, Path(sidecar_path)))
+
+    jobs = os.cpu_count() if jobs is None else max(1, jobs)
+
+    created: List[Path] = []
+    if use_processes and jobs > 1 and len(candidates) > 1:
+        censor_kwargs = {
+            'style':       censor.style,
+            'strength':    censor.strength,
+            'label_boxes': censor.label_boxes,
+        }
+        with ProcessPoolExecutor(max_workers=jobs) as ex:
+            results = ex.map(_censor_one,
+                             (c[0] for c in candidates),
+                             (c[1] for c in candidates),
+                             repeat(censor_kwargs),
+                             repeat(suffix))
+            created.extend(r for r in results if r is not None)
+    else:
+        items = []
+        for image_path, sidecar in candidates:
+            detections = _read_detections(sidecar)
+            if not detections:
+                continue
+            censored_path = image_path.with_name(image_path.stem + suffix + image_path.suffix)
+            items.append((image_path, censored_path, detections))
+        results = censor.create_copies_batch(items, max_workers=jobs)
+        created.extend(r for r in results if r is not None)
+
+    return created
+
+
+__all__ = [
+    'CENSOR_STYLES',
+    'CensorBox',
+    'ImageCensor',
+    'censor_sorted_tree',
+    'normalize_style',
+]
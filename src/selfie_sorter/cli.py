@@ -7,6 +7,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+from .censor import ImageCensor, censor_sorted_tree, normalize_style
 from .config import SortConfig
 from .sorter import SelfieSorter
 
@@ -41,6 +42,15 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument('--keep-safe', action='store_true', help='Keep safe images in place (do not move)')
     p.add_argument('--no-exif-strip', action='store_true', help='Do not remove metadata')
     p.add_argument('--dup-hamming', type=int, default=5)
+    p.add_argument('--censor', action='store_true',
+                   help='Write censored copies of sorted images with detections')
+    p.add_argument('--censor-style', default='pixelated', type=normalize_style,
+                   choices=['pixelated', 'blurred', 'black_box'],
+                   help='Censor style for --censor')
+    p.add_argument('--censor-strength', type=int, default=12,
+                   help='Censor intensity (pixel block size / blur radius)')
+    p.add_argument('--censor-jobs', type=int, default=None,
+                   help='Censor worker count (default: CPU count)')
     return p
 
 
@@ -73,5 +83,9 @@ def main() -> None:
     )
     SelfieSorter(cfg).run()
 
+    if a.censor:
+        censor = ImageCensor(style=a.censor_style, strength=a.censor_strength)
+        censor_sorted_tree(a.root_out, censor=censor, jobs=a.censor_jobs)
+
 if __name__ == '__main__':
     main()
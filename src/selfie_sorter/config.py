@@ -9,16 +9,21 @@ metadata handling, and more.
 """
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from .constants import EXPLICIT_RULES, SUGGESTIVE_RULES
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SortConfig:
     """
     Configuration for SelfieSorter.
 
+    Frozen with slots: the fields are read inside the pipeline's hot
+    loops, and slotted instances resolve attributes at fixed offsets
+    instead of through ``__dict__``. Nothing mutates a config after
+    construction.
+
     Attributes:
         root_in (Path):
             Input directory scanned recursively for images.
@@ -32,6 +37,17 @@ class SortConfig:
         nsfw_threshold (float):
             Coarse score threshold for suggestive fallback.
 
+        coarse_low (Optional[float]):
+            Lower edge of the coarse uncertainty band. Scores below it
+            skip fine detection entirely (clearly safe). ``None``
+            disables the band.
+
+        coarse_high (Optional[float]):
+            Upper edge of the coarse uncertainty band. Scores above it
+            skip fine detection (clearly NSFW; routed on the coarse
+            score alone, so per-label subdirs and sidecar detections
+            are lost for those files). ``None`` disables the band.
+
         explicit_rules (Tuple[str, ...]):
             Labels counted as explicit.
 
@@ -41,6 +57,25 @@ class SortConfig:
         dup_hamming (int):
             Perceptual hash Hamming distance for near-dupe detection.
 
+        dedupe_hash (str):
+            Hash used for the exact-copy fingerprint: 'xxh3' (falls
+            back to crc32 when xxhash is not installed), 'blake2b', or
+            'crc32'.
+
+        parallel_scan (bool):
+            Enumerate the input tree with a thread pool. Worthwhile on
+            network filesystems, where the walk is dominated by
+            per-directory round-trips; pointless on local disks.
+
+        batch_size (int):
+            Number of images scored per detector call. Batching amortizes
+            the fixed per-call model overhead.
+
+        detector_int8 (bool):
+            Quantize the fine-detector model to INT8 for CPU inference.
+            The quantized copy is built once and cached next to the
+            original model; ignored when a GPU provider is in use.
+
         strip_metadata (bool):
             If True, EXIF/GPS is removed in-place.
 
@@ -60,9 +95,15 @@ class SortConfig:
     root_out:         Path
     use_coarse_gate:  bool            = True
     nsfw_threshold:   float           = 0.80
+    coarse_low:       Optional[float] = None
+    coarse_high:      Optional[float] = None
     explicit_rules:   Tuple[str, ...] = EXPLICIT_RULES
     suggestive_rules: Tuple[str, ...] = SUGGESTIVE_RULES
     dup_hamming:      int             = 5
+    dedupe_hash:      str             = 'xxh3'
+    parallel_scan:    bool            = False
+    batch_size:       int             = 16
+    detector_int8:    bool            = False
     strip_metadata:   bool            = True
     write_sidecar:    bool            = True
     move_safe:        bool            = False
@@ -33,11 +33,11 @@ class TagRouter:
             Configuration object containing explicit and
             suggestive rules, as well as the NSFW threshold.
 
-        explicit_rules (set):
+        explicit_rules (frozenset):
             Processed set of explicit rules derived from
             the configuration.
 
-        suggestive_rules (set):
+        suggestive_rules (frozenset):
               Processed set of suggestive rules derived
               from the configuration.
     """
@@ -50,8 +50,9 @@ class TagRouter:
                 Configuration object containing explicit and suggestive rules.
         """
         self.cfg = cfg
-        self.explicit_rules = {r.upper().replace(' ', '_') for r in cfg.explicit_rules}
-        self.suggestive_rules = {r.upper().replace(' ', '_') for r in cfg.suggestive_rules}
+        self._threshold = cfg.nsfw_threshold
+        self.explicit_rules = frozenset(r.upper().replace(' ', '_') for r in cfg.explicit_rules)
+        self.suggestive_rules = frozenset(r.upper().replace(' ', '_') for r in cfg.suggestive_rules)
 
     @staticmethod
     def _lbl(d: Dict) -> str:
@@ -90,19 +91,25 @@ class TagRouter:
                 A tuple containing a classification label ('safe', 'explicit', or 'suggestive')
                 and a list of raw labels that contributed to the decision.
         """
-        raw_labels = sorted({self._lbl(d) for d in fine if self._lbl(d)})
-        labels_upper = [l.upper().replace(' ', '_') for l in raw_labels]
-
-        if coarse is not None and coarse < self.cfg.nsfw_threshold and not labels_upper:
+        _lbl = self._lbl
+        seen: Dict[str, str] = {}
+        for d in fine:
+            lbl = _lbl(d)
+            if lbl and lbl not in seen:
+                seen[lbl] = lbl.upper().replace(' ', '_')
+        raw_labels = sorted(seen)
+        labels_set = set(seen.values())
+
+        if coarse is not None and coarse < self._threshold and not labels_set:
             return ('safe', [])
 
-        if any(l in self.explicit_rules for l in labels_upper):
+        if labels_set & self.explicit_rules:
             return ('explicit', raw_labels)
 
-        if any(l in self.suggestive_rules for l in labels_upper):
+        if labels_set & self.suggestive_rules:
             return ('suggestive', raw_labels)
 
-        if coarse is not None and coarse >= self.cfg.nsfw_threshold:
+        if coarse is not None and coarse >= self._threshold:
             return ('suggestive', raw_labels)
 
         return ('safe', raw_labels)
@@ -12,21 +12,34 @@ management.
 
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+import errno
 import json
+import os
+import queue
+import threading
 import shutil
-import hashlib
-from typing import List
+from typing import Dict, List, Optional
 
 from .constants import IMAGE_EXTS
 from .config import SortConfig
+from .prepared import prepare_image
 from .coarse import CoarseGate
-from .detector import FineDetector
+from .detector import EMPTY_FINE, FineDetector, FineResult
 from .router import TagRouter
 from .dedupe import Deduper
 from .metadata import MetadataCleaner
 
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+
 class SelfieSorter:
     """
     Orchestrates de-duplication, classification, metadata stripping, and file movement.
@@ -38,9 +51,9 @@ class SelfieSorter:
 
         This constructor method sets up the primary components of the process
         pipeline, including coarse filtering, fine detection, routing, deduplication,
-        and metadata cleaning processes. It also ensures that the required
-        directories for explicit, suggestive, safe, and duplicate file outputs
-        are created if they do not already exist.
+        and metadata cleaning processes. Output directories are created lazily
+        as files are routed to them, so a run only touches the buckets it
+        actually uses.
 
         Parameters:
             cfg (SortConfig):
@@ -49,13 +62,33 @@ class SelfieSorter:
         """
         self.cfg = cfg
         self.coarse = CoarseGate(cfg)
-        self.fine = FineDetector()
+        self.fine = FineDetector(cfg)
         self.router = TagRouter(cfg)
         self.dedupe = Deduper(cfg)
         self.cleaner = MetadataCleaner(cfg)
 
-        for d in [cfg.dir_explicit, cfg.dir_suggestive, cfg.dir_safe, cfg.dir_dupes]:
-            (cfg.root_out / d).mkdir(parents=True, exist_ok=True)
+        # Output dirs are created lazily on first use; see _ensure_dir.
+        self._created_dirs: set = set()
+
+        # Known names per destination dir, seeded with one listing; see
+        # _unique_dest.
+        self._dir_names: dict = {}
+
+        # (bucket, label) -> destination Path, built on first use.
+        self._dest_dirs: dict = {}
+
+        # Dedicated writer pool, live only during run(); see _write_sidecar.
+        self._sidecar_pool: Optional[ThreadPoolExecutor] = None
+
+        # _move only ever targets the dupes bucket; resolve it once.
+        self._dupes_dir = cfg.root_out / cfg.dir_dupes
+
+        # When input and output share a device, every move is a plain
+        # rename and the EXDEV fallback machinery can be skipped.
+        try:
+            self._same_fs = os.stat(cfg.root_in).st_dev == os.stat(cfg.root_out).st_dev
+        except OSError:
+            self._same_fs = False
 
     def run(self) -> None:
         """
@@ -80,32 +113,292 @@ class SelfieSorter:
         Returns:
             None
         """
-        files: List[Path] = [
-            p for p in self.cfg.root_in.rglob('*')
-            if p.is_file() and p.suffix.lower() in self.IMAGE_EXTS
-        ]
-        for path in files:
+        if self.cfg.parallel_scan:
+            files: List[Path] = self._parallel_scan(self.cfg.root_in)
+        else:
+            files = list(self._iter_images(self.cfg.root_in))
+
+        # Deterministic processing order regardless of scan strategy.
+        # Schwartzian transform: one fsencode+lower per file instead of
+        # per comparison, and bytes compare faster than str.
+        keyed = [(os.fsencode(path).lower(), path) for path in files]
+        keyed.sort()
+        files = [path for _, path in keyed]
+        batch_size = max(1, self.cfg.batch_size)
+        batches: 'queue.Queue' = queue.Queue(maxsize=2)
+
+        def _produce() -> None:
+            # Stage 1: dedupe-filter batches ahead of the inference stage.
+            # phash decoding is I/O + PIL work, so it overlaps inference.
+            it = iter(files)
+            # Bound methods resolved once; the loop body runs per file.
+            is_exact_duplicate = self.dedupe.is_exact_duplicate
+            is_duplicate = self.dedupe.is_duplicate
+            move = self._move
+            dir_dupes = self.cfg.dir_dupes
             try:
-                self._process_one(path)
-            except KeyboardInterrupt:
-                raise
-            except Exception:
+                while True:
+                    chunk = list(islice(it, batch_size))
+                    if not chunk:
+                        break
+                    pending = []
+                    for path in chunk:
+                        try:
+                            # Exact copies are settled by a whole-file
+                            # content fingerprint before paying for a
+                            # decode.
+                            if is_exact_duplicate(path):
+                                move(path, dir_dupes)
+                                continue
+                            prep = prepare_image(path)
+                            if is_duplicate(prep):
+                                move(path, dir_dupes)
+                            else:
+                                pending.append(prep)
+                        except Exception:
+                            continue
+                    if pending:
+                        batches.put(pending)
+            finally:
+                batches.put(None)
+
+        producer = threading.Thread(target=_produce, name='selfie-sorter-scan', daemon=True)
+        producer.start()
+
+        # Stage 3: filesystem side effects run behind the inference stage.
+        # The executor queue is unbounded, so without back-pressure a slow
+        # output filesystem lets pending finalize work pile up without
+        # limit; the semaphore caps it at twice the worker count.
+        slots = threading.BoundedSemaphore(8)
+
+        def _release(_future) -> None:
+            slots.release()
+
+        # Sidecar writes get their own small pool so a slow JSON write
+        # never holds up a move worker; entered first so it drains last,
+        # after the finalize workers stop feeding it.
+        with ThreadPoolExecutor(max_workers=2) as sidecar_pool, \
+                ThreadPoolExecutor(max_workers=4) as finalize_pool, \
+                ThreadPoolExecutor(max_workers=1) as score_pool:
+            self._sidecar_pool = sidecar_pool
+            try:
+                while True:
+                    pending = batches.get()
+                    if pending is None:
+                        break
+                    for prep, (coarse, fine) in zip(pending, self._classify_batch(pending, score_pool)):
+                        slots.acquire()
+                        future = finalize_pool.submit(self._finalize_safe, prep.path, coarse, fine)
+                        future.add_done_callback(_release)
+            finally:
+                self._sidecar_pool = None
+
+        producer.join()
+
+    def _classify_batch(self, pending: List, score_pool: ThreadPoolExecutor) -> List[tuple]:
+        """
+        Scores one batch through both models and pairs up the results.
+
+        The coarse gate runs on ``score_pool`` while the fine detector
+        runs on the calling thread — both release the GIL, so the two
+        model passes overlap. Files whose coarse score already settles
+        the outcome skip the fine detector and get empty detections:
+        below-threshold scores when safe files stay put and no sidecar
+        records the decision, and scores outside the configured
+        ``coarse_low``/``coarse_high`` uncertainty band, where the
+        coarse verdict is confident enough to route on alone.
+
+        Parameters:
+            pending (List):
+                Batch of :class:`~selfie_sorter.prepared.PreparedImage`
+                items to score.
+
+            score_pool (ThreadPoolExecutor):
+                Single-worker pool the coarse pass is submitted to.
+
+        Returns:
+            List[tuple]:
+                One ``(coarse, fine)`` pair per batch item, in order.
+        """
+        coarse_future = score_pool.submit(self.coarse.score_batch, pending)
+        cfg = self.cfg
+        elide_fine = not cfg.move_safe and not cfg.write_sidecar
+        threshold = cfg.nsfw_threshold
+        low, high = cfg.coarse_low, cfg.coarse_high
+
+        def _needs_fine(c) -> bool:
+            if c is None:
+                return True
+            if elide_fine and c < threshold:
+                return False
+            if low is not None and c < low:
+                return False
+            if high is not None and c > high:
+                return False
+            return True
+
+        if elide_fine or low is not None or high is not None:
+            coarse_scores = coarse_future.result()
+            suspect = [prep for prep, c in zip(pending, coarse_scores)
+                       if _needs_fine(c)]
+            detections = iter(self.fine.detect_batch(suspect) if suspect else [])
+            fine_results = [next(detections) if _needs_fine(c) else EMPTY_FINE
+                            for c in coarse_scores]
+        else:
+            fine_results = self.fine.detect_batch(pending)
+            coarse_scores = coarse_future.result()
+        return list(zip(coarse_scores, fine_results))
+
+    def _iter_images(self, root: Path):
+        """
+        Yields image paths under ``root`` via an os.scandir walk.
+
+        ``rglob('*')`` stats every entry and allocates a Path for each;
+        scandir reuses the directory entry's cached type (no extra stat
+        syscall) and the extension filter lowercases only the suffix tail
+        of the raw entry name before a set lookup, so Path objects are
+        only built for actual images. Files that pass the filter are
+        deduplicated by ``(st_dev, st_ino)`` using the DirEntry's cached
+        stat, so hardlinked copies and bind-mount repeats are processed
+        once.
+
+        Parameters:
+            root (Path):
+                Directory to walk recursively.
+
+        Yields:
+            Path:
+                Each image file found.
+        """
+        exts = self.IMAGE_EXTS
+        seen: set = set()
+        stack = [str(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
                 continue
+            with it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            name = entry.name
+                            dot = name.rfind('.')
+                            if dot < 0 or name[dot:].lower() not in exts:
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                            key = (st.st_dev, st.st_ino)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+
+    def _parallel_scan(self, root: Path) -> List[Path]:
+        """
+        Enumerates image paths under ``root`` with a thread pool.
+
+        On NFS/SMB mounts each directory listing is a network round-trip,
+        so the sequential walk of :meth:`_iter_images` is latency-bound.
+        Here every directory is scanned as its own task, keeping many
+        round-trips in flight at once. Completion is tracked by counting
+        outstanding directories; ordering of the result is unspecified.
+        Accepted files are deduplicated by ``(st_dev, st_ino)`` under the
+        shared lock, mirroring :meth:`_iter_images`, so hardlinked copies
+        are enumerated once in either scan mode.
+
+        Parameters:
+            root (Path):
+                Directory to walk recursively.
+
+        Returns:
+            List[Path]:
+                Every image file found.
+        """
+        exts = self.IMAGE_EXTS
+        files: List[Path] = []
+        seen: set = set()
+        lock = threading.Lock()
+        outstanding = [1]
+        done = threading.Event()
+
+        def _scan(dirpath: str) -> None:
+            subdirs = []
+            found = []
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                subdirs.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                name = entry.name
+                                dot = name.rfind('.')
+                                if dot >= 0 and name[dot:].lower() in exts:
+                                    st = entry.stat(follow_symlinks=False)
+                                    found.append(((st.st_dev, st.st_ino), Path(entry.path)))
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            with lock:
+                for key, path in found:
+                    if key not in seen:
+                        seen.add(key)
+                        files.append(path)
+                outstanding[0] += len(subdirs) - 1
+                if outstanding[0] == 0:
+                    done.set()
+            for sub in subdirs:
+                pool.submit(_scan, sub)
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            pool.submit(_scan, str(root))
+            done.wait()
+        return files
+
+    def _finalize_safe(self, path: Path, coarse, fine: FineResult) -> None:
+        """
+        Worker wrapper around :meth:`_finalize_one` that silences per-file
+        failures, matching the old per-file loop's behavior.
+
+        Parameters:
+            path (Path):
+                The path of the file to finalize.
+
+            coarse (Optional[float]):
+                Coarse NSFW score for the file.
+
+            fine (FineResult):
+                Fine-grained detection result for the file.
+        """
+        try:
+            self._finalize_one(path, coarse, fine)
+        except Exception:
+            pass
 
-    def _process_one(self, path: Path) -> None:
+    def _finalize_one(self, path: Path, coarse, fine: FineResult) -> None:
         """
-        Processes a single file by determining its categorization, optionally moving it
-        to designated directories, and writing metadata as needed.
+        Applies the filesystem side effects for one scored file.
 
-        The method checks if the file is a duplicate, assesses its scores and labels
-        via the coarse and fine models, and classifies it into a bucket and labels. It
-        then processes the file by moving it to the appropriate directory structure
-        and optionally writes a metadata sidecar file with relevant classification
-        information.
+        Classifies the file from its coarse score and fine detections,
+        strips metadata, moves it into the bucket/label directory tree, and
+        optionally writes a metadata sidecar with the decision.
 
         Parameters:
             path (Path):
-                The path of the file we want to process.
+                The path of the file to finalize.
+
+            coarse (Optional[float]):
+                Coarse NSFW score for the file, if the gate is enabled.
+
+            fine (FineResult):
+                Fine-grained detection result for the file, with its
+                best label already picked by the detector.
 
         Raises:
             OSError:
@@ -114,60 +407,158 @@ class SelfieSorter:
             ValueError:
                 Raised if data from classifiers is malformed.
         """
-        if self.dedupe.is_duplicate(path):
-            self._move(path, self.cfg.dir_dupes)
-            return
-
-        coarse = self.coarse.score(path)
-        fine = self.fine.detect(path)
-        bucket, labels = self.router.classify(coarse, fine)
+        cfg = self.cfg
+        bucket, labels = self.router.classify(coarse, fine.detections)
 
         self.cleaner.strip(path)
 
-        if bucket == 'safe' and not self.cfg.move_safe:
+        if bucket == 'safe' and not cfg.move_safe:
             return
 
-        label_dir = 'unlabeled'
-        if fine:
-            best = max(fine, key=lambda d: d.get('score', 0.0))
-            best_label = (best.get('label') or best.get('class') or 'unlabeled')
-            label_dir = best_label.lower().replace(' ', '_')
+        label_dir = fine.best_label
 
-        dest_dir = self.cfg.root_out / bucket / label_dir
-        dest_dir.mkdir(parents=True, exist_ok=True)
+        dest_dir = self._dest_dirs.get((bucket, label_dir))
+        if dest_dir is None:
+            dest_dir = cfg.root_out / bucket / label_dir
+            self._dest_dirs[(bucket, label_dir)] = dest_dir
+        self._ensure_dir(dest_dir)
 
         dest_path = self._unique_dest(dest_dir / path.name)
-        shutil.move(str(path), dest_path)
+        self._move_file(path, dest_path)
 
-        if self.cfg.write_sidecar:
+        if cfg.write_sidecar:
             meta = {
                 'coarse_score': coarse,
                 'bucket': bucket,
                 'labels': labels,
-                'detections': fine,
+                'detections': fine.detections,
             }
-            with open(dest_path.with_suffix(dest_path.suffix + '.json'), 'w', encoding='utf-8') as fh:
-                json.dump(meta, fh, ensure_ascii=False, indent=2)
+            pool = self._sidecar_pool
+            if pool is not None:
+                pool.submit(self._write_sidecar, dest_path, meta)
+            else:
+                self._write_sidecar(dest_path, meta)
 
     @staticmethod
-    def _unique_dest(base: Path) -> Path:
+    def _write_sidecar(dest_path: Path, meta: Dict) -> None:
         """
-        Generates a unique file path in case the provided path already exists. This function appends
-        a short hash digest to the file name before the file extension to ensure it is unique.
+        Serializes and writes one decision sidecar next to ``dest_path``.
+
+        Runs on the dedicated sidecar pool during a pipeline run so the
+        write latency overlaps the move workers; failures are silenced
+        like every other per-file side effect.
+
+        Parameters:
+            dest_path (Path):
+                Final location of the moved image.
+
+            meta (Dict):
+                Decision record to serialize.
+        """
+        try:
+            if HAS_ORJSON:
+                payload = orjson.dumps(meta, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(meta, ensure_ascii=False, indent=2).encode('utf-8')
+            # Raw fd write: the payload is one small pre-serialized blob,
+            # so the buffered-file layer only adds overhead here.
+            fd = os.open(dest_path.with_suffix(dest_path.suffix + '.json'),
+                         os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, payload)
+            finally:
+                os.close(fd)
+        except Exception:
+            pass
+
+    def _ensure_dir(self, d: Path) -> None:
+        """
+        Creates ``d`` on first use and memoizes it.
+
+        The per-file mkdir(exist_ok=True) paid a syscall per image; the
+        memo reduces that to one per distinct destination directory. A
+        racing duplicate mkdir from the finalize workers is harmless
+        (``exist_ok=True``), so no lock is needed.
+
+        Parameters:
+            d (Path):
+                Directory that must exist before a move into it.
+        """
+        if d not in self._created_dirs:
+            d.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(d)
+
+    def _move_file(self, src: Path, dst: Path) -> None:
+        """
+        Moves ``src`` to ``dst``, preferring a single rename syscall.
+
+        ``shutil.move`` stats both paths and walks Python-level fallback
+        logic on every call; on the common same-filesystem layout the move
+        is really just ``rename(2)``. When ``__init__`` has verified that
+        input and output share a device, ``os.replace`` is called bare;
+        otherwise the cross-device case (EXDEV) falls back to the copying
+        move.
+
+        Parameters:
+            src (Path):
+                The file to move.
+
+            dst (Path):
+                The destination path (already reserved by
+                :meth:`_unique_dest`).
+        """
+        if self._same_fs:
+            os.replace(src, dst)
+            return
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), dst)
+
+    def _unique_dest(self, base: Path) -> Path:
+        """
+        Atomically reserves a unique destination path for a move.
+
+        The name is claimed with ``os.open(O_CREAT | O_EXCL)``, which fails
+        atomically when it already exists, so concurrent finalize workers
+        can never race each other onto the same name (the old
+        ``exists()``-then-move check could). A per-directory name cache —
+        seeded with one listing and updated as names are claimed — steers
+        the candidate choice so collision-heavy directories don't pay a
+        failed open per taken suffix; the O_EXCL open remains the
+        authority, so an external writer can still only cost a retry.
 
         Parameters:
             base (Path):
-                The initial file path to check for uniqueness.
+                The preferred destination path.
 
         Returns:
             Path:
-                A modified file path that is guaranteed to be unique.
+                A reserved path that is guaranteed to be unique.
         """
-        if not base.exists():
-            return base
+        names = self._dir_names.get(base.parent)
+        if names is None:
+            try:
+                names = set(os.listdir(base.parent))
+            except OSError:
+                names = set()
+            names = self._dir_names.setdefault(base.parent, names)
+
         stem, ext = base.stem, base.suffix
-        digest = hashlib.sha1(str(base).encode('utf-8')).hexdigest()[:8]
-        return base.with_name(f'{stem}_{digest}{ext}')
+        candidate = base
+        i = 0
+        while True:
+            if candidate.name not in names:
+                try:
+                    os.close(os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    names.add(candidate.name)
+                    return candidate
+                except FileExistsError:
+                    names.add(candidate.name)
+            i += 1
+            candidate = base.with_name(f'{stem}_{i}{ext}')
 
     def _move(self, src: Path, sub: str) -> None:
         """
@@ -180,7 +571,8 @@ class SelfieSorter:
                 where the file should be moved.
 
         """
-        target_dir = self.cfg.root_out / sub
-        target_dir.mkdir(parents=True, exist_ok=True)
+        target_dir = self._dupes_dir if sub == self.cfg.dir_dupes \
+            else self.cfg.root_out / sub
+        self._ensure_dir(target_dir)
         dest = self._unique_dest(target_dir / src.name)
-        shutil.move(str(src), dest)
+        self._move_file(src, dest)